@@ -26,6 +26,7 @@ const mimeTypes = {
   '.js': 'text/javascript',
   '.css': 'text/css',
   '.json': 'application/json',
+  '.map': 'application/json',
   '.png': 'image/png',
   '.jpg': 'image/jpeg',
   '.gif': 'image/gif',
@@ -63,8 +64,8 @@ function requestHandler(req, res) {
   res.setHeader('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS');
   res.setHeader('Access-Control-Allow-Headers', 'Content-Type, Authorization');
   
-  // Disable caching for development
-  res.setHeader('Cache-Control', 'no-cache, no-store, must-revalidate');
+  // Always revalidate for development (ETag lets unchanged files answer with 304)
+  res.setHeader('Cache-Control', 'no-cache, must-revalidate');
   res.setHeader('Pragma', 'no-cache');
   res.setHeader('Expires', '0');
   
@@ -75,31 +76,70 @@ function requestHandler(req, res) {
     return;
   }
   
-  fs.readFile(filePath, (err, data) => {
+  fs.stat(filePath, (err, stats) => {
     if (err) {
       if (err.code === 'ENOENT') {
         // Try to serve index.html for SPA routing
         const indexPath = path.join(config.distDir, 'index.html');
-        fs.readFile(indexPath, (indexErr, indexData) => {
+        fs.stat(indexPath, (indexErr, indexStats) => {
           if (indexErr) {
             res.writeHead(404, { 'Content-Type': 'text/plain' });
             res.end('Not Found');
           } else {
-            res.writeHead(200, { 'Content-Type': 'text/html' });
-            res.end(indexData);
+            sendFile(req, res, indexPath, 'text/html', indexStats);
           }
         });
       } else {
         res.writeHead(500, { 'Content-Type': 'text/plain' });
         res.end('Internal Server Error');
       }
+    } else if (!stats.isFile()) {
+      res.writeHead(500, { 'Content-Type': 'text/plain' });
+      res.end('Internal Server Error');
     } else {
-      res.writeHead(200, { 'Content-Type': mimeType });
-      res.end(data);
+      sendFile(req, res, filePath, mimeType, stats);
     }
   });
 }
 
+// Weak validator derived from size and mtime, so no file content has to be hashed
+function getETag(stats) {
+  return `W/"${stats.size.toString(16)}-${Math.floor(stats.mtimeMs).toString(16)}"`;
+}
+
+// Check conditional request headers; If-None-Match takes precedence over If-Modified-Since
+function isNotModified(req, etag, stats) {
+  const ifNoneMatch = req.headers['if-none-match'];
+  if (ifNoneMatch) {
+    return ifNoneMatch === etag;
+  }
+
+  const ifModifiedSince = Date.parse(req.headers['if-modified-since']);
+  // HTTP dates have one-second resolution
+  return !isNaN(ifModifiedSince) && Math.floor(stats.mtimeMs / 1000) * 1000 <= ifModifiedSince;
+}
+
+// Stream the file to the response instead of buffering it whole in memory
+function sendFile(req, res, filePath, mimeType, stats) {
+  const etag = getETag(stats);
+  res.setHeader('ETag', etag);
+  res.setHeader('Last-Modified', stats.mtime.toUTCString());
+
+  if (isNotModified(req, etag, stats)) {
+    res.writeHead(304);
+    res.end();
+    return;
+  }
+
+  res.writeHead(200, {
+    'Content-Type': mimeType,
+    'Content-Length': stats.size
+  });
+  fs.createReadStream(filePath)
+    .on('error', () => res.destroy())
+    .pipe(res);
+}
+
 function startServer() {
   // Check if dist directory exists
   if (!fs.existsSync(config.distDir)) {
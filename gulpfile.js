@@ -138,9 +138,9 @@ function styles() {
       level: 2
     }));
     
-    // Add hash to filename in production
-    stream = stream.pipe(rename(function(path) {
-      const hash = crypto.createHash('md5').update(Date.now().toString()).digest('hex').substring(0, 8);
+    // Add content hash to filename in production, so unchanged CSS keeps its URL across deploys
+    stream = stream.pipe(rename(function(path, file) {
+      const hash = crypto.createHash('md5').update(file.contents).digest('hex').substring(0, 8);
       path.basename = `app-${hash}`;
       global.cssFilename = `${path.basename}.css`;
     }));
@@ -159,25 +159,28 @@ async function bundleAssets() {
   }
 
   try {
-    // Read all template files
-    const templateFiles = await glob('templates/**/*.html');
+    const [templateFiles, svgFiles] = await Promise.all([
+      glob('templates/**/*.html'),
+      glob('assets/**/*.svg')
+    ]);
+
+    // Read all template and SVG files concurrently instead of one at a time
+    const [templateContents, svgContents] = await Promise.all([
+      Promise.all(templateFiles.map(file => fs.readFile(file, 'utf8'))),
+      Promise.all(svgFiles.map(file => fs.readFile(file, 'utf8')))
+    ]);
+
     const templates = {};
-    
-    for (const templateFile of templateFiles) {
-      const content = await fs.readFile(templateFile, 'utf8');
+    templateFiles.forEach((templateFile, i) => {
       const templateName = path.basename(templateFile, '.html');
-      templates[templateName] = content;
-    }
+      templates[templateName] = templateContents[i];
+    });
 
-    // Read SVG assets
-    const svgFiles = await glob('assets/**/*.svg');
     const svgAssets = {};
-    
-    for (const svgFile of svgFiles) {
-      const content = await fs.readFile(svgFile, 'utf8');
+    svgFiles.forEach((svgFile, i) => {
       const assetName = path.relative('assets', svgFile);
-      svgAssets[assetName] = content;
-    }
+      svgAssets[assetName] = svgContents[i];
+    });
 
     // Create the bundled assets object
     const bundledAssets = {
@@ -306,10 +309,10 @@ function dev() {
 }
 
 // Build task
+// bundleAssets only reads templates/ and assets/, so it runs alongside scripts and styles
 const build = gulp.series(
   clean,
-  gulp.parallel(scripts, styles),
-  bundleAssets,
+  gulp.parallel(scripts, styles, bundleAssets),
   gulp.parallel(html, templates, languages, assets)
 );
 
@@ -64,6 +64,22 @@ class BaseController {
     return out;
   }
 
+  /**
+  * Pack finetune values into a feature report payload
+  * @param {number[]} data Finetune values (uint16)
+  * @returns {Array} Header [12, 1] followed by each value as little-endian bytes
+  */
+  packFinetuneData(data) {
+    const pkg = new Array(2 + data.length * 2);
+    pkg[0] = 12;
+    pkg[1] = 1;
+    for (let i = 0; i < data.length; i++) {
+      pkg[2 + i * 2] = data[i] & 0xff;
+      pkg[3 + i * 2] = data[i] >> 8;
+    }
+    return pkg;
+  }
+
   /**
   * Send feature report to device
   * @param {number} reportId Report ID
@@ -556,8 +556,7 @@ class DS5Controller extends BaseController {
   }
 
   async writeFinetuneData(data) {
-    const pkg = data.reduce((acc, val) => acc.concat([val & 0xff, val >> 8]), [12, 1]);
-    await this.sendFeatureReport(0x80, pkg);
+    await this.sendFeatureReport(0x80, this.packFinetuneData(data));
   }
 
   /**
@@ -238,11 +238,6 @@ class DS5EdgeController extends DS5Controller {
     return Array.from({ length: 12 }, (_, i) => data.getUint16(4 + i * 2, true));
   }
 
-  async writeFinetuneData(data) {
-    const pkg = data.reduce((acc, val) => acc.concat([val & 0xff, val >> 8]), [12, 1]);
-    await this.sendFeatureReport(0x80, pkg)
-  }
-
   getNumberOfSticks() {
     return 2;
   }
@@ -35,8 +35,9 @@ const app = {
   gu: 0
 };
 
-const ll_data = new Array(CIRCULARITY_DATA_SIZE);
-const rr_data = new Array(CIRCULARITY_DATA_SIZE);
+// Preallocated, zero-filled buffers: max distance reached per angular position
+const ll_data = new Float64Array(CIRCULARITY_DATA_SIZE);
+const rr_data = new Float64Array(CIRCULARITY_DATA_SIZE);
 
 let controller = null;
 
@@ -482,8 +483,7 @@ function collectCircularityData(stickStates, leftData, rightData) {
     // atan2 gives angle in radians, convert to array index with proper wrapping
     const angleIndex = (parseInt(Math.round(Math.atan2(y, x) * MAX_N / 2.0 / Math.PI)) + MAX_N) % MAX_N;
     // Store maximum distance reached at this angle (for circularity analysis)
-    const oldValue = data[angleIndex] ?? 0;
-    data[angleIndex] = Math.max(oldValue, distance);
+    data[angleIndex] = Math.max(data[angleIndex], distance);
   }
 }
 
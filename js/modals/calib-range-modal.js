@@ -2,7 +2,7 @@
 
 import { sleep } from '../utils.js';
 import { l } from '../translations.js';
-import { CIRCULARITY_DATA_SIZE } from '../stick-renderer.js';
+import { CIRCULARITY_DATA_SIZE, count_above } from '../stick-renderer.js';
 
 const SECONDS_UNTIL_UNLOCK = 15;
 
@@ -156,7 +156,7 @@ export class CalibRangeModal {
     const CIRCLE_FILL_THRESHOLD = 0.95;
 
     // Count the number of times the joysticks have been rotated full circle
-    const leftNonZeroCount = this.ll_data.filter(v => v > JOYSTICK_EXTREME_THRESHOLD).length
+    const leftNonZeroCount = count_above(this.ll_data, JOYSTICK_EXTREME_THRESHOLD);
     const leftFillRatio = leftNonZeroCount / CIRCULARITY_DATA_SIZE;
     if (leftFillRatio >= CIRCLE_FILL_THRESHOLD) {
       this.leftFullCycles++;
@@ -170,7 +170,7 @@ export class CalibRangeModal {
         this.updateProgress();
       }
     } else {
-      const rightNonZeroCount = this.rr_data.filter(v => v > JOYSTICK_EXTREME_THRESHOLD).length;
+      const rightNonZeroCount = count_above(this.rr_data, JOYSTICK_EXTREME_THRESHOLD);
       const rightFillRatio = rightNonZeroCount / CIRCULARITY_DATA_SIZE;
       if (rightFillRatio >= CIRCLE_FILL_THRESHOLD) {
         this.rightFullCycles++;
@@ -973,8 +973,11 @@ export class QuickTestModal {
 
         analyzer.getByteFrequencyData(dataArray);
 
-        // Calculate average level
-        const sum = dataArray.reduce((acc, value) => acc + value, 0);
+        // Calculate average level (plain loop over the typed array, runs every animation frame)
+        let sum = 0;
+        for (let i = 0; i < bufferLength; i++) {
+          sum += dataArray[i];
+        }
         const average = sum / bufferLength;
         const percentage = Math.min(100, (average / 255) * 100);
 
@@ -3,6 +3,30 @@
 // Constants
 export const CIRCULARITY_DATA_SIZE = 48; // Number of angular positions to sample
 
+// Unit vectors of each angular position, computed once instead of on every redraw
+const CIRCULARITY_COS = new Float64Array(CIRCULARITY_DATA_SIZE);
+const CIRCULARITY_SIN = new Float64Array(CIRCULARITY_DATA_SIZE);
+for (let i = 0; i < CIRCULARITY_DATA_SIZE; i++) {
+    const angle = i * 2 * Math.PI / CIRCULARITY_DATA_SIZE;
+    CIRCULARITY_COS[i] = Math.cos(angle);
+    CIRCULARITY_SIN[i] = Math.sin(angle);
+}
+
+/**
+ * Counts values above a threshold without allocating a filtered copy.
+ * @param {ArrayLike<number>} data - Circularity data
+ * @param {number} threshold - Exclusive lower bound
+ * @param {number} limit - Stop counting once this many values are found
+ * @returns {number} Number of values greater than threshold, capped at limit
+ */
+export function count_above(data, threshold, limit = Infinity) {
+    let count = 0;
+    for (let i = 0; i < data.length && count < limit; i++) {
+        if (data[i] > threshold) count++;
+    }
+    return count;
+}
+
 /**
  * Draws analog stick position on a canvas with various visualization options.
  * @param {CanvasRenderingContext2D} ctx - Canvas rendering context
@@ -45,16 +69,16 @@ export function draw_stick_position(ctx, center_x, center_y, sz, stick_x, stick_
         const MAX_N = CIRCULARITY_DATA_SIZE;
 
         for(let i = 0; i < MAX_N; i++) {
+            const i1 = (i+1) % MAX_N;
             const kd = circularity_data[i];
-            const kd1 = circularity_data[(i+1) % CIRCULARITY_DATA_SIZE];
-            if (kd === undefined || kd1 === undefined) continue;
-            const ka = i * Math.PI * 2 / MAX_N;
-            const ka1 = ((i+1)%MAX_N) * 2 * Math.PI / MAX_N;
+            const kd1 = circularity_data[i1];
+            // Skip segments between never-sampled slots (buffers are zero-filled)
+            if (kd === 0 && kd1 === 0) continue;
 
-            const kx = Math.cos(ka) * kd;
-            const ky = Math.sin(ka) * kd;
-            const kx1 = Math.cos(ka1) * kd1;
-            const ky1 = Math.sin(ka1) * kd1;
+            const kx = CIRCULARITY_COS[i] * kd;
+            const ky = CIRCULARITY_SIN[i] * kd;
+            const kx1 = CIRCULARITY_COS[i1] * kd1;
+            const ky1 = CIRCULARITY_SIN[i1] * kd1;
 
             ctx.beginPath();
             ctx.moveTo(center_x, center_y);
@@ -71,7 +95,7 @@ export function draw_stick_position(ctx, center_x, center_y, sz, stick_x, stick_
     }
 
     // Draw circularity error text if enough data provided
-    if (circularity_data?.filter(n => n > 0.3).length > 10) {
+    if (circularity_data && count_above(circularity_data, 0.3, 11) > 10) {
         const circularityError = calculateCircularityError(circularity_data);
 
         ctx.fillStyle = '#fff';
@@ -169,12 +193,19 @@ export function draw_stick_position(ctx, center_x, center_y, sz, stick_x, stick_
  * @returns {number} RMS deviation as percentage
  */
 function calculateCircularityError(data) {
-    // Sum of squared deviations from ideal distance of 1.0, only for values > 0.2
-    const sumSquaredDeviations = data.reduce((acc, val) =>
-        val > 0.2 ? acc + Math.pow(val - 1, 2) : acc, 0);
+    // Sum of squared deviations from ideal distance of 1.0 and count of values > 0.2, in one pass
+    let sumSquaredDeviations = 0;
+    let validDataCount = 0;
+    for (let i = 0; i < data.length; i++) {
+        const val = data[i];
+        if (val > 0.2) {
+            const deviation = val - 1;
+            sumSquaredDeviations += deviation * deviation;
+            validDataCount++;
+        }
+    }
 
     // Calculate RMS deviation as percentage
-    const validDataCount = data.filter(val => val > 0.2).length;
     return validDataCount > 0 ? Math.sqrt(sumSquaredDeviations / validDataCount) * 100 : 0;
 }
 
@@ -193,18 +224,16 @@ function apply_center_zoom(x, y) {
         return { x, y};
     }
 
-    // Calculate angle
-    const angle = Math.atan2(y, x);
-
     // Apply center zoom transformation
     const new_distance =
         distance <= 0.05
         ? (distance / 0.05) * 0.5 // 0 to 0.05 maps to 0 to 0.5 (half the radius)
         : 0.5 + ((distance - 0.05) / 0.95) * 0.5 // 0.05 to 1.0 maps to 0.5 to 1.0 (other half)
 
-    // Convert back to x, y coordinates
+    // Scale along the same direction; equivalent to cos/sin of atan2(y, x) without the trig calls
+    const scale = new_distance / distance;
     return {
-        x: Math.cos(angle) * new_distance,
-        y: Math.sin(angle) * new_distance
+        x: x * scale,
+        y: y * scale
     };
 }
@@ -22,9 +22,9 @@
 #   python3 scripts/check_translations.py --verbose # Show excluded strings
 #   python3 scripts/check_translations.py --json    # Output in JSON format
 
-import os
 import re
 import json
+import bisect
 import sys
 from pathlib import Path
 
@@ -51,6 +51,23 @@ EXCLUDE_PATTERNS = [
     r'^(hide|show)$',  # Common CSS display values
 ]
 
+# All exclude patterns combined into a single precompiled regex
+EXCLUDE_RE = re.compile('|'.join(f'(?:{p})' for p in EXCLUDE_PATTERNS))
+
+# Precompiled extraction patterns, shared by all files
+# Elements with ds-i18n class in HTML files (DOTALL allows multi-line content)
+DS_I18N_RE = re.compile(r'<(\w+)[^>]*class="[^"]*ds-i18n[^"]*"[^>]*>(.*?)</\1>', re.DOTALL)
+# Elements with ds-i18n class in HTML embedded in JavaScript strings (single or double quotes)
+DS_I18N_JS_RE = re.compile(r'<(\w+)[^>]*class=["\'][^"\']*ds-i18n[^"\']*["\'][^>]*>(.*?)</\1>', re.DOTALL)
+# l("string") or l('string') or this.l("string"); \b keeps 'l' from matching inside e.g. .html
+L_FUNCTION_RE = re.compile(r'(?:this\.)?\bl\s*\(\s*["\']([^"\']+)["\']\s*\)')
+# Simple formatting tags allowed inside translatable content
+SIMPLE_TAGS_RE = re.compile(r'</?(?:b|i|em|strong|span)>')
+HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+JS_LINE_COMMENT_RE = re.compile(r'//.*?$', re.MULTILINE)
+JS_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+NEWLINE_RE = re.compile(r'\n')
+
 # Whitelist of strings that are in language files but should be ignored by unused check
 # These strings may be used dynamically, in comments, or reserved for future use
 WHITELIST_UNUSED = {
@@ -102,10 +119,21 @@ WHITELIST_UNUSED = {
 
 def should_exclude_string(text):
     """Check if a string should be excluded from translation checks."""
-    for pattern in EXCLUDE_PATTERNS:
-        if re.match(pattern, text):
-            return True
-    return False
+    return EXCLUDE_RE.match(text) is not None
+
+def build_line_index(content):
+    """Return the sorted offsets of every newline in content."""
+    return [match.start() for match in NEWLINE_RE.finditer(content)]
+
+def offset_to_line_col(line_index, offset):
+    """Convert a character offset to a 1-based (line, col) using a line index.
+
+    Binary search over the newline offsets avoids rescanning the content
+    before every match.
+    """
+    newlines_before = bisect.bisect_left(line_index, offset)
+    line_start = line_index[newlines_before - 1] if newlines_before else -1
+    return newlines_before + 1, offset - line_start
 
 def find_html_files():
     """Find all HTML files in the project."""
@@ -129,158 +157,143 @@ def extract_ds_i18n_strings(html_files):
     """
     strings = {}  # Changed to dict to track locations
 
-    # Pattern to match elements with ds-i18n class and extract their content
-    # This handles various HTML structures including multi-line content
-    # Match opening tag with ds-i18n class, then capture content until closing tag
-    pattern = r'<(\w+)[^>]*class="[^"]*ds-i18n[^"]*"[^>]*>(.*?)</\1>'
-
     for html_file in html_files:
         try:
             with open(html_file, 'r', encoding='utf-8') as f:
                 content = f.read()
-                lines = content.split('\n')
-
-                # Remove HTML comments before processing
-                # This regex handles both single-line and multi-line comments
-                content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
-
-                # Find all matches (DOTALL flag allows . to match newlines)
-                matches = re.finditer(pattern, content, re.DOTALL)
-                for match in matches:
-                    text = match.group(2)
-
-                    # Skip if contains complex nested HTML tags
-                    # Allow simple formatting tags like <b>, <i>, <em>, <strong>, <span>
-                    if '<' in text and '>' in text:
-                        # Check if it contains only simple formatting tags
-                        # Remove simple formatting tags temporarily to check for other HTML
-                        text_without_simple_tags = re.sub(r'</?(?:b|i|em|strong|span)>', '', text)
-                        if '<' in text_without_simple_tags:
-                            # Contains other HTML elements (complex content), skip it
-                            continue
-                        # Otherwise, keep the original text with simple formatting tags
-
-                    if text:
-                        # Calculate line and column number
-                        line_num = content[:match.start()].count('\n') + 1
-                        col_num = match.start() - content[:match.start()].rfind('\n')
-
-                        # Store location info
-                        if text not in strings:
-                            strings[text] = []
-                        strings[text].append({
-                            'file': str(html_file),
-                            'line': line_num,
-                            'col': col_num
-                        })
-
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             print(f"Error reading {html_file}: {e}")
+            continue
+
+        # Remove HTML comments before processing
+        # This regex handles both single-line and multi-line comments
+        content = HTML_COMMENT_RE.sub('', content)
+
+        line_index = build_line_index(content)
+
+        # Find all matches
+        matches = DS_I18N_RE.finditer(content)
+        for match in matches:
+            text = match.group(2)
+
+            # Skip if contains complex nested HTML tags
+            # Allow simple formatting tags like <b>, <i>, <em>, <strong>, <span>
+            if '<' in text and '>' in text:
+                # Check if it contains only simple formatting tags
+                # Remove simple formatting tags temporarily to check for other HTML
+                text_without_simple_tags = SIMPLE_TAGS_RE.sub('', text)
+                if '<' in text_without_simple_tags:
+                    # Contains other HTML elements (complex content), skip it
+                    continue
+                # Otherwise, keep the original text with simple formatting tags
+
+            if text:
+                # Calculate line and column number
+                line_num, col_num = offset_to_line_col(line_index, match.start())
+
+                # Store location info
+                strings.setdefault(text, []).append({
+                    'file': str(html_file),
+                    'line': line_num,
+                    'col': col_num
+                })
 
     return strings
 
-def extract_l_function_strings(js_files):
-    """Extract strings passed to l() function in JavaScript files.
+def read_js_sources(js_files):
+    """Read each JavaScript file once and strip its comments.
 
-    Automatically ignores JavaScript comments (// and /* ... */) before extraction.
-    """
-    strings = {}  # Changed to dict to track locations
+    Both JavaScript extractors work on the same sources, so files are read and
+    comment-stripped a single time here instead of once per extractor.
 
-    # Pattern to match l("string") or l('string') or this.l("string") or this.l('string')
-    # Handles both single and double quotes
-    # Use word boundary \b to ensure 'l' is not part of a larger word (e.g., .html)
-    pattern = r'(?:this\.)?\bl\s*\(\s*["\']([^"\']+)["\']\s*\)'
+    Returns:
+        list: (js_file, original_content, content) tuples, where content has
+            JavaScript comments (// and /* ... */) removed
+    """
+    sources = []
 
     for js_file in js_files:
         try:
             with open(js_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-                # Remove JavaScript comments before processing
-                # Remove single-line comments (// ...)
-                content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-                # Remove multi-line comments (/* ... */)
-                content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-
-                # Find all matches
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    text = match.group(1)
-                    if text:
-                        # Calculate line and column number
-                        line_num = content[:match.start()].count('\n') + 1
-                        col_num = match.start() - content[:match.start()].rfind('\n')
-
-                        # Store location info
-                        if text not in strings:
-                            strings[text] = []
-                        strings[text].append({
-                            'file': str(js_file),
-                            'line': line_num,
-                            'col': col_num
-                        })
-
-        except Exception as e:
+                original_content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
             print(f"Error reading {js_file}: {e}")
+            continue
+
+        # Remove JavaScript comments before processing
+        # Remove single-line comments (// ...)
+        content = JS_LINE_COMMENT_RE.sub('', original_content)
+        # Remove multi-line comments (/* ... */)
+        content = JS_BLOCK_COMMENT_RE.sub('', content)
+
+        sources.append((js_file, original_content, content))
+
+    return sources
+
+def extract_l_function_strings(js_sources):
+    """Extract strings passed to l() function in JavaScript files.
+
+    Expects sources from read_js_sources(), with comments already stripped.
+    """
+    strings = {}  # Changed to dict to track locations
+
+    for js_file, _, content in js_sources:
+        line_index = build_line_index(content)
+
+        # Find all matches
+        matches = L_FUNCTION_RE.finditer(content)
+        for match in matches:
+            text = match.group(1)
+            if text:
+                # Calculate line and column number
+                line_num, col_num = offset_to_line_col(line_index, match.start())
+
+                # Store location info
+                strings.setdefault(text, []).append({
+                    'file': str(js_file),
+                    'line': line_num,
+                    'col': col_num
+                })
 
     return strings
 
-def extract_html_strings_from_js(js_files):
+def extract_html_strings_from_js(js_sources):
     """Extract strings from HTML embedded in JavaScript files.
 
     This function looks for HTML strings in JavaScript that contain elements with ds-i18n class.
-    Automatically ignores JavaScript comments (// and /* ... */) before extraction.
+    Expects sources from read_js_sources(), with comments already stripped.
     """
     strings = {}  # Dict to track locations
 
-    # Pattern to match elements with ds-i18n class in HTML strings
-    # This handles HTML within JavaScript strings (both single and double quotes)
-    pattern = r'<(\w+)[^>]*class=["\'][^"\']*ds-i18n[^"\']*["\'][^>]*>(.*?)</\1>'
-
-    for js_file in js_files:
-        try:
-            with open(js_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                original_content = content  # Keep original for line number calculation
-
-                # Remove JavaScript comments before processing
-                # Remove single-line comments (// ...)
-                content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-                # Remove multi-line comments (/* ... */)
-                content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-
-                # Find all matches (DOTALL flag allows . to match newlines)
-                matches = re.finditer(pattern, content, re.DOTALL)
-                for match in matches:
-                    text = match.group(2)
-
-                    # Skip if contains complex nested HTML tags
-                    # Allow simple formatting tags like <b>, <i>, <em>, <strong>, <span>
-                    if '<' in text and '>' in text:
-                        # Check if it contains only simple formatting tags
-                        # Remove simple formatting tags temporarily to check for other HTML
-                        text_without_simple_tags = re.sub(r'</?(?:b|i|em|strong|span)>', '', text)
-                        if '<' in text_without_simple_tags:
-                            # Contains other HTML elements (complex content), skip it
-                            continue
-                        # Otherwise, keep the original text with simple formatting tags
-
-                    if text:
-                        # Calculate line and column number using original content
-                        line_num = original_content[:match.start()].count('\n') + 1
-                        col_num = match.start() - original_content[:match.start()].rfind('\n')
-
-                        # Store location info
-                        if text not in strings:
-                            strings[text] = []
-                        strings[text].append({
-                            'file': str(js_file),
-                            'line': line_num,
-                            'col': col_num
-                        })
-
-        except Exception as e:
-            print(f"Error reading {js_file}: {e}")
+    for js_file, original_content, content in js_sources:
+        line_index = build_line_index(original_content)
+
+        # Find all matches
+        matches = DS_I18N_JS_RE.finditer(content)
+        for match in matches:
+            text = match.group(2)
+
+            # Skip if contains complex nested HTML tags
+            # Allow simple formatting tags like <b>, <i>, <em>, <strong>, <span>
+            if '<' in text and '>' in text:
+                # Check if it contains only simple formatting tags
+                # Remove simple formatting tags temporarily to check for other HTML
+                text_without_simple_tags = SIMPLE_TAGS_RE.sub('', text)
+                if '<' in text_without_simple_tags:
+                    # Contains other HTML elements (complex content), skip it
+                    continue
+                # Otherwise, keep the original text with simple formatting tags
+
+            if text:
+                # Calculate line and column number using original content
+                line_num, col_num = offset_to_line_col(line_index, match.start())
+
+                # Store location info
+                strings.setdefault(text, []).append({
+                    'file': str(js_file),
+                    'line': line_num,
+                    'col': col_num
+                })
 
     return strings
 
@@ -307,14 +320,18 @@ def load_translation_keys():
             # Extract language code from filename (e.g., "en_us" from "en_us.json")
             lang_code = lang_file.stem
 
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(lang_file, 'rb') as f:
+                data = json.loads(f.read())
+                if not isinstance(data, dict):
+                    print(f"Error reading {lang_file}: expected a JSON object")
+                    continue
                 keys = set(data.keys())
                 keys.discard("")  # Remove empty string key if present
 
                 keys_by_language[lang_code] = keys
                 all_keys.update(keys)
-        except Exception as e:
+        except (OSError, ValueError) as e:
+            # ValueError covers malformed JSON and invalid UTF-8
             print(f"Error reading {lang_file}: {e}")
 
     # Remove empty string key if present
@@ -344,8 +361,9 @@ def main():
     if not JSON_OUTPUT:
         print("Extracting translation strings from source files...")
     ds_i18n_strings = extract_ds_i18n_strings(html_files)
-    l_function_strings = extract_l_function_strings(js_files)
-    html_in_js_strings = extract_html_strings_from_js(js_files)
+    js_sources = read_js_sources(js_files)
+    l_function_strings = extract_l_function_strings(js_sources)
+    html_in_js_strings = extract_html_strings_from_js(js_sources)
 
     if not JSON_OUTPUT:
         print(f"Found {len(ds_i18n_strings)} strings with ds-i18n class in HTML files")
@@ -356,18 +374,9 @@ def main():
     # Combine all used strings and filter out excluded patterns
     # Merge the three dictionaries, combining location lists for duplicate strings
     all_used_strings_with_locations = {}
-    for text, locations in ds_i18n_strings.items():
-        all_used_strings_with_locations[text] = locations.copy()
-    for text, locations in l_function_strings.items():
-        if text in all_used_strings_with_locations:
-            all_used_strings_with_locations[text].extend(locations)
-        else:
-            all_used_strings_with_locations[text] = locations.copy()
-    for text, locations in html_in_js_strings.items():
-        if text in all_used_strings_with_locations:
-            all_used_strings_with_locations[text].extend(locations)
-        else:
-            all_used_strings_with_locations[text] = locations.copy()
+    for strings in (ds_i18n_strings, l_function_strings, html_in_js_strings):
+        for text, locations in strings.items():
+            all_used_strings_with_locations.setdefault(text, []).extend(locations)
 
     excluded_strings = {s for s in all_used_strings_with_locations.keys() if should_exclude_string(s)}
     used_strings_with_locations = {k: v for k, v in all_used_strings_with_locations.items() if k not in excluded_strings}
@@ -17,7 +17,12 @@ import re
 def check_blueutil():
     """Check if blueutil is installed."""
     try:
-        subprocess.run(['blueutil', '--version'], capture_output=True, check=True)
+        subprocess.run(
+            ['blueutil', '--version'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True
+        )
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
@@ -58,8 +63,8 @@ def forget_device(address):
     try:
         subprocess.run(
             ['blueutil', '--unpair', address],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True
         )
         return True
@@ -23,7 +23,9 @@ data = {
 import os, json
 
 def process_file(filename):
-    x = json.loads(open(filename, "r").read())
+    # json.loads() accepts UTF-8 bytes directly, no separate text decode pass
+    with open(filename, "rb") as f:
+        x = json.loads(f.read())
 
     modified = False
     for i in data["remove"]:
@@ -71,4 +73,6 @@ for i in files:
         continue
     print("%s: writing changes" % (i, ))
 
-    open("lang/" + i, "w").write(new_file)
+    # Encode once and write the whole file in a single binary write
+    with open("lang/" + i, "wb") as f:
+        f.write(new_file.encode("utf-8"))